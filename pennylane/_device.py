@@ -476,9 +476,10 @@ class Device(abc.ABC):
             # increment counter for number of executions of device
             self._num_executions += 1
 
-            if self.tracker.active:
-                self.tracker.update(executions=1, shots=self._shots)
-                self.tracker.record()
+            tracker = self.tracker
+            if tracker.active:
+                tracker.update(executions=1, shots=self._shots)
+                tracker.record()
 
             # Ensures that a combination with sample does not put
             # expvals and vars in superfluous arrays
@@ -513,9 +514,10 @@ class Device(abc.ABC):
             res = self.execute(circuit.operations, circuit.observables)
             results.append(res)
 
-        if self.tracker.active:
-            self.tracker.update(batches=1, batch_len=len(circuits))
-            self.tracker.record()
+        tracker = self.tracker
+        if tracker.active:
+            tracker.update(batches=1, batch_len=len(circuits))
+            tracker.record()
 
         return results
 
@@ -359,9 +359,10 @@ class QubitDevice(Device):
         # increment counter for number of executions of qubit device
         self._num_executions += 1
 
-        if self.tracker.active:
-            self.tracker.update(executions=1, shots=self._shots)
-            self.tracker.record()
+        tracker = self.tracker
+        if tracker.active:
+            tracker.update(executions=1, shots=self._shots)
+            tracker.record()
 
         return results
 
@@ -579,9 +580,10 @@ class QubitDevice(Device):
             res = self.execute(circuit)
             results.append(res)
 
-        if self.tracker.active:
-            self.tracker.update(batches=1, batch_len=len(circuits))
-            self.tracker.record()
+        tracker = self.tracker
+        if tracker.active:
+            tracker.update(batches=1, batch_len=len(circuits))
+            tracker.record()
 
         return results
 
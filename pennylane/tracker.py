@@ -17,10 +17,11 @@ This module contains a class for updating and recording information about device
 
 # pylint: disable=attribute-defined-outside-init
 
+from collections import Counter, deque
 from numbers import Number
 
 
-class Tracker:
+class Tracker:  # pylint: disable=too-many-instance-attributes
     """This class stores information about device executions and allows users to interact with that
     data upon individual executions and batches, even within parameter-shift gradients and
     optimization steps.
@@ -30,7 +31,9 @@ class Tracker:
 
     * ``latest`` tracks the last set of information passed to the tracker.
     * ``history`` stores a list of values passed for each keyword.
-    * ``totals`` keeps a running sum per keyword when the values are numeric.
+    * ``totals`` keeps a running sum per keyword when the values are numeric. It is a
+      :class:`collections.Counter`, so callbacks that display the data can use its
+      methods, such as ``totals.most_common()`` for sorted output, at no extra cost.
 
     Standard devices will track the number of executions, number of shots, number of batch
     executions, and batch execution length, but plugins may store additional information with
@@ -48,6 +51,12 @@ class Tracker:
             the corresponding attributes.
         persistent=False (bool): Whether to reset stored information upon
             entering a runtime context.
+        max_history=None (int or None): If set, each ``history`` entry is kept in a
+            bounded ``deque`` of this length instead of a list, so old values are
+            evicted and memory stays constant during long-running jobs.
+        batched=False (bool): If ``True``, ``update`` only buffers the passed values,
+            and the buffered updates are merged into ``totals`` and ``history`` in a
+            single pass on the next ``record`` call or upon exiting the context.
 
 
     **Example**
@@ -72,7 +81,7 @@ class Tracker:
     You can then access the tabulated information through ``totals``, ``history``, and ``latest``:
 
     >>> tracker.totals
-    {'executions': 3, 'shots': 300, 'batches': 1, 'batch_len': 2}
+    Counter({'shots': 300, 'executions': 3, 'batch_len': 2, 'batches': 1})
     >>> tracker.history
     {'executions': [1, 1, 1],
      'shots': [100, 100, 100],
@@ -122,12 +131,19 @@ class Tracker:
 
     """
 
-    def __init__(self, dev=None, callback=None, persistent=False):
+    def __init__(self, dev=None, callback=None, persistent=False, max_history=None, batched=False):
+        # pylint: disable=too-many-arguments
         self.persistent = persistent
 
         self.callback = callback
 
-        self.reset()
+        self._max_history = max_history
+        self._batched = batched
+
+        self.totals = Counter()
+        self.history = {}
+        self.latest = {}
+        self._pending = []
 
         self.active = False
 
@@ -144,54 +160,120 @@ class Tracker:
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
+        self._flush_pending()
         self.active = False
 
-    def update(self, **kwargs):
+    def update(self, _current=None, **kwargs):
         """Store passed keyword-value pairs into ``totals``,``history``, and ``latest`` attributes.
 
         There is no restriction on the key-value pairs passed, but in the standard devices, the
         device ``execute`` method will pass ``executions`` and ``shots``, and the ``batch_execute``
         method will pass ``batches`` and ``batch_len``.
 
-        Only numeric values will be added to ``totals``.
+        Only numeric values will be added to ``totals``.  If the tracker is not ``active``,
+        the call returns immediately without storing anything.
 
+        >>> tracker.active = True
         >>> tracker.update(a=1, b=2, c="c")
         >>> tracker.latest
         {"a":1, "b":2, "c":"c"}
         >>> tracker.history
         {"a": [1], "b": [2], "c": ["c"]}
         >>> tracker.totals
-        {"a": 1, "b": 2}
+        Counter({'b': 2, 'a': 1})
+
+        When the values are already collected in a dictionary, it can be passed
+        positionally instead, which skips unpacking and rebuilding a keyword
+        dictionary. The dictionary is stored by reference, so it should not be
+        mutated afterwards:
+
+        >>> tracker.update({"a": 1, "b": 2, "c": "c"})
 
         """
-        self.latest = kwargs
+        if not self.active:
+            return
+
+        if _current is None:
+            _current = kwargs
+        elif kwargs:
+            _current = {**_current, **kwargs}
 
-        for key, value in kwargs.items():
+        self.latest = _current
+
+        if self._batched:
+            self._pending.append(_current)
+            return
+
+        # bind attributes to locals so the loop avoids repeated instance-dict lookups
+        history = self.history
+        totals = self.totals
+        max_history = self._max_history
+
+        for key, value in _current.items():
             # update history
-            if key in self.history:
-                self.history[key].append(value)
-            else:
-                self.history[key] = [value]
+            container = history.get(key)
+            if container is None:
+                container = deque(maxlen=max_history) if max_history is not None else []
+                history[key] = container
+            container.append(value)
+
+            # updating totals; isinstance filters out None and other non-numeric values
+            if isinstance(value, Number):
+                totals[key] += value
+
+    def _flush_pending(self):
+        """Merge any buffered batched updates into ``totals`` and ``history``.
 
-            # updating totals
-            if value is not None:
-                # Only total numeric values
-                if isinstance(value, Number):
-                    self.totals[key] = value + self.totals.get(key, 0)
+        Grouping the buffered dictionaries by key lets each key pay for a single
+        ``extend`` and a single totals addition, rather than per-update appends.
+        """
+        if not self._pending:
+            return
+
+        agg = {}
+        for current in self._pending:
+            for key, value in current.items():
+                agg.setdefault(key, []).append(value)
+
+        for key, values in agg.items():
+            container = self.history.get(key)
+            if container is None:
+                container = deque(maxlen=self._max_history) if self._max_history is not None else []
+                self.history[key] = container
+            container.extend(values)
+
+            numeric = [value for value in values if isinstance(value, Number)]
+            if numeric:
+                self.totals[key] += sum(numeric)
+
+        self._pending = []
 
     def reset(self):
-        """Resets stored information."""
-        self.totals = {}
-        self.history = {}
+        """Resets stored information.
+
+        The ``totals`` and ``history`` containers are cleared in place rather than
+        replaced, so references held to them remain valid after the reset.
+        """
+        self.totals.clear()
+        self.history.clear()
         self.latest = {}
+        self._pending.clear()
 
     def record(self):
-        """This method allows users to interact with the stored data.  While it's intended purpose
+        """This method allows users to interact with the stored data.  While its intended purpose
         is monitoring large jobs through ``print`` statements or logging, the function is
         completely flexible and customizable.
 
         If a user provided a ``callback`` function during initialization, that function is called
         with the current ``totals``, ``history``, and ``latest`` data variables as keyword arguments.
+
+        When the tracker is not ``active``, the method returns without calling the callback.
         """
-        if self.callback is not None:
-            self.callback(totals=self.totals, history=self.history, latest=self.latest)
+        if not self.active:
+            return
+
+        self._flush_pending()
+
+        callback = self.callback
+        if callback is not None:
+            callback(totals=self.totals, history=self.history, latest=self.latest)
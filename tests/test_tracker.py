@@ -126,6 +126,7 @@ class TestTrackerCoreBehavior:
         """Checks update stores to history and totals"""
 
         tracker = Tracker()
+        tracker.active = True
 
         tracker.update(a=1, b="b", c=None)
         tracker.update(a=2, b="b2", c=1)
@@ -136,6 +137,93 @@ class TestTrackerCoreBehavior:
 
         assert tracker.latest == {"a": 2, "b": "b2", "c": 1}
 
+    def test_update_positional_dict(self):
+        """Checks update accepts a dictionary passed positionally"""
+
+        tracker = Tracker()
+        tracker.active = True
+
+        tracker.update({"a": 1, "b": "b"})
+        tracker.update({"a": 2}, c=3)
+
+        assert tracker.history == {"a": [1, 2], "b": ["b"], "c": [3]}
+        assert tracker.totals == {"a": 3, "c": 3}
+        assert tracker.latest == {"a": 2, "c": 3}
+
+    def test_update_max_history(self):
+        """Checks max_history bounds the per-key history length"""
+
+        tracker = Tracker(max_history=2)
+        tracker.active = True
+
+        tracker.update(a=1)
+        tracker.update(a=2)
+        tracker.update(a=3)
+
+        assert list(tracker.history["a"]) == [2, 3]
+        assert tracker.totals == {"a": 6}
+
+    def test_update_max_history_zero(self):
+        """Checks max_history=0 disables history storage while keeping totals"""
+
+        tracker = Tracker(max_history=0)
+        tracker.active = True
+
+        tracker.update(a=1)
+        tracker.update(a=2)
+
+        assert list(tracker.history["a"]) == []
+        assert tracker.totals == {"a": 3}
+
+    def test_update_batched(self):
+        """Checks batched mode buffers updates and merges them on record"""
+
+        tracker = Tracker(batched=True)
+        tracker.active = True
+
+        tracker.update(a=1, b="b")
+        tracker.update(a=2, c=None)
+
+        assert tracker.history == dict()
+        assert tracker.totals == dict()
+        assert tracker.latest == {"a": 2, "c": None}
+
+        tracker.record()
+
+        assert tracker.history == {"a": [1, 2], "b": ["b"], "c": [None]}
+        assert tracker.totals == {"a": 3}
+
+    def test_update_batched_flushed_on_exit(self):
+        """Checks buffered updates are merged upon exiting the context"""
+
+        with Tracker(batched=True) as tracker:
+            tracker.update(a=1)
+            tracker.update(a=2)
+
+        assert tracker.history == {"a": [1, 2]}
+        assert tracker.totals == {"a": 3}
+
+    def test_update_inactive(self, mocker):
+        """Checks update and record are no-ops when the tracker is inactive"""
+
+        class callback_wrapper:
+            @staticmethod
+            def callback(totals, history, latest):
+                pass
+
+        wrapper = callback_wrapper()
+        spy = mocker.spy(wrapper, "callback")
+
+        tracker = Tracker(callback=wrapper.callback)
+
+        tracker.update(a=1)
+        tracker.record()
+
+        assert tracker.history == dict()
+        assert tracker.totals == dict()
+        assert tracker.latest == dict()
+        assert spy.call_count == 0
+
     def test_record_callback(self, mocker):
         class callback_wrapper:
             @staticmethod
@@ -146,6 +234,7 @@ class TestTrackerCoreBehavior:
         spy = mocker.spy(wrapper, "callback")
 
         tracker = Tracker(callback=wrapper.callback)
+        tracker.active = True
 
         tracker.totals = {"a": 1, "b": 2}
         tracker.history = {"a": [1], "b": [1, 1]}